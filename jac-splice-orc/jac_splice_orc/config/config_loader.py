@@ -1,8 +1,12 @@
 # config_loader.py
 
-import os
 import json
 import logging
+from importlib.resources import files
+
+# Bundled default config, resolved once through the package rather than
+# rebuilt from __file__ for every loader
+DEFAULT_CONFIG_PATH = files("jac_splice_orc.config").joinpath("config.json")
 
 
 class ConfigLoader:
@@ -10,8 +14,7 @@ class ConfigLoader:
 
     def __init__(self, config_file_path=None):
         if config_file_path is None:
-            # Default config file path
-            config_file_path = os.path.join(os.path.dirname(__file__), "config.json")
+            config_file_path = DEFAULT_CONFIG_PATH
         self.config_file_path = config_file_path
         self.config = self.load_config()
 
@@ -50,8 +53,11 @@ class ConfigLoader:
     def save_config(self):
         """Save the current configuration back to the JSON file."""
         try:
+            # Serialize first so the file is written in one call and is not
+            # left truncated if serialization fails
+            data = json.dumps(self.config, indent=4)
             with open(self.config_file_path, "w") as f:
-                json.dump(self.config, f, indent=4)
+                f.write(data)
             logging.info(f"Configuration saved to {self.config_file_path}")
         except Exception as e:
             logging.error(f"Error saving configuration: {e}")
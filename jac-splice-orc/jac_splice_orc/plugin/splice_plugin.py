@@ -1,12 +1,16 @@
 """JAC Splice-Orchestrator Plugin."""
 
+import hashlib
 import json
 import os
 import time
 import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Union
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from jaclang.cli.cmdreg import cmd_registry
 from jac_splice_orc.managers.proxy_manager import ModuleProxy
 from jac_splice_orc.config.config_loader import ConfigLoader
@@ -22,6 +26,70 @@ hookimpl = pluggy.HookimplMarker("jac")
 config_loader = ConfigLoader()
 
 
+@lru_cache(maxsize=1)
+def jaclang_importers() -> tuple:
+    """Import the jaclang runtime symbols used by jac_import once."""
+    from jaclang.runtimelib.importer import (
+        ImportPathSpec,
+        JacImporter,
+        PythonImporter,
+    )
+    from jaclang.runtimelib.machine import JacMachine, JacProgram
+
+    return ImportPathSpec, JacImporter, PythonImporter, JacMachine, JacProgram
+
+
+def module_config_mtime(module_config_path: str) -> Optional[int]:
+    """Modification time of the module config file, or None if it is missing."""
+    try:
+        return os.stat(module_config_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def read_module_config(
+    module_config_path: str, mtime_ns: Optional[int]
+) -> tuple[frozenset, dict]:
+    """
+    Read the module config for one version of the file, along with the
+    names of the modules configured to load remotely.
+    """
+    try:
+        logging.info(f"Loading from {module_config_path} for module_config...")
+        with open(module_config_path, "r") as f:
+            module_config = json.load(f)
+    except Exception as e:
+        logging.warning(
+            f"No module_config found in config_map ({module_config_path}). "
+            f"Defaulting to fallback file. Error: {e}"
+        )
+        module_config = config_loader.get("module_config", default={})
+    remote = frozenset(
+        name
+        for name, module in module_config.items()
+        if isinstance(module, dict) and module.get("load_type") == "remote"
+    )
+    return remote, module_config
+
+
+def load_module_config(module_config_path: str) -> tuple[frozenset, dict]:
+    """
+    Load the remote module names and module config from the config map.
+    The parsed file is reused until it is modified, created or removed,
+    so a call costs one stat().
+    """
+    return read_module_config(
+        module_config_path, module_config_mtime(module_config_path)
+    )
+
+
+@lru_cache(maxsize=4)
+def get_module_proxy(pod_manager_url: str) -> ModuleProxy:
+    """Reuse one ModuleProxy per pod manager URL."""
+    return ModuleProxy(pod_manager_url)
+
+
 def try_incluster_or_local() -> bool:
     """
     Attempt to load in-cluster config if we're in a real K8s Pod
@@ -50,9 +118,106 @@ def try_incluster_or_local() -> bool:
         return False
 
 
+ROLE_NAME = "smartimport-role"
+ROLE_BINDING_NAME = "smartimport-rolebinding"
+FIELD_MANAGER = "jac-splice-orc"
+CONNECTION_POOL_MAXSIZE = 16
+
+# Server-side apply endpoints, filled in from each body's metadata
+APPLY_PATHS = {
+    "Namespace": "/api/v1/namespaces/{name}",
+    "ServiceAccount": "/api/v1/namespaces/{namespace}/serviceaccounts/{name}",
+    "Role": "/apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/roles/{name}",
+    "RoleBinding": (
+        "/apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/rolebindings/{name}"
+    ),
+    "Deployment": "/apis/apps/v1/namespaces/{namespace}/deployments/{name}",
+    "Service": "/api/v1/namespaces/{namespace}/services/{name}",
+}
+
+# Sentinels left by successful bootstraps, one per API server and namespace,
+# so repeat runs can skip the cluster setup
+BOOTSTRAP_DIR = Path("~/.cache/jac_splice_orc").expanduser()
+BOOTSTRAP_TTL = 3600
+
+# Static Role permissions, sent as plain JSON rather than built as client.V1*
+# models on every run
+ROLE_RULES = [
+    # Permissions for pods and services
+    {
+        "apiGroups": [""],
+        "resources": ["pods", "services", "configmaps", "roles"],
+        "verbs": ["get", "watch", "list", "create", "update", "delete"],
+    },
+    # Permissions for deployments
+    {
+        "apiGroups": ["apps"],
+        "resources": ["deployments"],
+        "verbs": ["get", "watch", "list", "create", "update", "delete"],
+    },
+]
+
+
+def server_side_apply(api_client, body) -> None:
+    """
+    Create or update a resource with a single server-side apply PATCH.
+    Conflicts are resolved by the API server, so no read or 404/409
+    handling is needed and changed fields are reconciled on every run.
+
+    The generated patch_* methods cannot send the apply-patch content type,
+    so the request goes through ApiClient.call_api directly.
+    """
+    kind = body["kind"]
+    metadata = body["metadata"]
+    try:
+        api_client.call_api(
+            APPLY_PATHS[kind],
+            "PATCH",
+            path_params={
+                key: metadata[key] for key in ("name", "namespace") if key in metadata
+            },
+            query_params=[("fieldManager", FIELD_MANAGER), ("force", True)],
+            header_params={
+                "Accept": "application/json",
+                "Content-Type": "application/apply-patch+yaml",
+            },
+            body=body,
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+        )
+        logging.info(f"{kind} '{metadata['name']}' applied.")
+    except client.exceptions.ApiException as e:
+        logging.error(f"Error applying {kind} '{metadata['name']}': {e}")
+        raise
+
+
 class SpliceOrcPlugin:
     """JAC Splice-Orchestrator Plugin."""
 
+    # Kubernetes clients, built once per process by load_kube_clients()
+    _in_cluster: bool = False
+    _api_client: Optional[client.ApiClient] = None
+    _v1: Optional[client.CoreV1Api] = None
+
+    @classmethod
+    def load_kube_clients(cls) -> bool:
+        """
+        Load the kube config and build the API clients on first use, then
+        reuse them (and their connection pool) for every later call.
+        Returns True if in-cluster config was loaded.
+        """
+        if cls._api_client is None:
+            cls._in_cluster = try_incluster_or_local()
+            # Keep a pooled connection per concurrent bootstrap request so
+            # parallel calls reuse TLS sessions instead of re-handshaking
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = max(
+                configuration.connection_pool_maxsize or 0, CONNECTION_POOL_MAXSIZE
+            )
+            cls._api_client = client.ApiClient(configuration)
+            cls._v1 = client.CoreV1Api(cls._api_client)
+        return cls._in_cluster
+
     @staticmethod
     def is_kind_cluster():
         """Detect if the cluster is a kind cluster."""
@@ -74,133 +239,64 @@ class SpliceOrcPlugin:
         """Create a new namespace if it does not exist."""
         logging.info(f"Creating namespace '{namespace_name}'")
 
-        in_cluster = try_incluster_or_local()
-
-        v1 = client.CoreV1Api()
-        # Check if the namespace exists
-        namespaces = v1.list_namespace()
-        if any(ns.metadata.name == namespace_name for ns in namespaces.items):
-            logging.info(f"Namespace '{namespace_name}' already exists.")
-        else:
-            ns = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace_name))
-            v1.create_namespace(ns)
-            logging.info(f"Namespace '{namespace_name}' created.")
+        cls.load_kube_clients()
+        ns = {
+            "apiVersion": "v1",
+            "kind": "Namespace",
+            "metadata": {"name": namespace_name},
+        }
+        server_side_apply(cls._api_client, ns)
 
     @classmethod
-    def create_service_account(cls, namespace):
-        _ = try_incluster_or_local()
-        v1 = client.CoreV1Api()
-        service_account_name = config_loader.get(
-            "kubernetes", "service_account_name", default="jac-orc-sa"
-        )
+    def create_service_account(cls, namespace, service_account_name):
+        """Create the ServiceAccount if it does not exist."""
+        cls.load_kube_clients()
+        sa = {
+            "apiVersion": "v1",
+            "kind": "ServiceAccount",
+            "metadata": {"name": service_account_name, "namespace": namespace},
+        }
+        server_side_apply(cls._api_client, sa)
 
-        # Check if the ServiceAccount already exists
-        try:
-            v1.read_namespaced_service_account(
-                name=service_account_name, namespace=namespace
-            )
-            logging.info(
-                f"ServiceAccount '{service_account_name}' already exists in namespace '{namespace}'."
-            )
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create the ServiceAccount
-                sa = client.V1ServiceAccount(
-                    metadata=client.V1ObjectMeta(name=service_account_name)
-                )
-                v1.create_namespaced_service_account(namespace=namespace, body=sa)
-                logging.info(
-                    f"ServiceAccount '{service_account_name}' created in namespace '{namespace}'."
-                )
-            else:
-                logging.error(f"Error creating ServiceAccount: {e}")
-                raise
-
-        # Create the Role and RoleBinding
-        cls.create_role_and_binding(namespace, service_account_name)
+    @classmethod
+    def create_role(cls, namespace):
+        """Create the Role used by the Pod Manager."""
+        cls.load_kube_clients()
+        role = {
+            "apiVersion": "rbac.authorization.k8s.io/v1",
+            "kind": "Role",
+            "metadata": {"name": ROLE_NAME, "namespace": namespace},
+            "rules": ROLE_RULES,
+        }
+        server_side_apply(cls._api_client, role)
 
     @classmethod
-    def create_role_and_binding(cls, namespace, service_account_name):
-        _ = try_incluster_or_local()
-        rbac_api = client.RbacAuthorizationV1Api()
-
-        role_name = "smartimport-role"
-        role_binding_name = "smartimport-rolebinding"
-
-        # Define the Role with updated permissions
-        role = client.V1Role(
-            metadata=client.V1ObjectMeta(name=role_name, namespace=namespace),
-            rules=[
-                # Permissions for pods and services
-                client.V1PolicyRule(
-                    api_groups=[""],
-                    resources=["pods", "services", "configmaps", "roles"],
-                    verbs=["get", "watch", "list", "create", "update", "delete"],
-                ),
-                # Permissions for deployments
-                client.V1PolicyRule(
-                    api_groups=["apps"],
-                    resources=["deployments"],
-                    verbs=["get", "watch", "list", "create", "update", "delete"],
-                ),
+    def create_role_binding(cls, namespace, service_account_name):
+        """Bind the Role to the ServiceAccount."""
+        cls.load_kube_clients()
+        role_binding = {
+            "apiVersion": "rbac.authorization.k8s.io/v1",
+            "kind": "RoleBinding",
+            "metadata": {"name": ROLE_BINDING_NAME, "namespace": namespace},
+            "subjects": [
+                {
+                    "kind": "ServiceAccount",
+                    "name": service_account_name,
+                    "namespace": namespace,
+                }
             ],
-        )
-        try:
-            rbac_api.read_namespaced_role(name=role_name, namespace=namespace)
-            logging.info(
-                f"Role '{role_name}' already exists in namespace '{namespace}'."
-            )
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create the Role
-                rbac_api.create_namespaced_role(namespace=namespace, body=role)
-                logging.info(f"Role '{role_name}' created in namespace '{namespace}'.")
-            else:
-                logging.error(f"Error creating Role: {e}")
-                raise
-
-        # Define the RoleBinding
-        role_binding = client.V1RoleBinding(
-            metadata=client.V1ObjectMeta(name=role_binding_name, namespace=namespace),
-            subjects=[
-                client.RbacV1Subject(
-                    kind="ServiceAccount",
-                    name=service_account_name,
-                    namespace=namespace,
-                )
-            ],
-            role_ref=client.V1RoleRef(
-                kind="Role",
-                name=role_name,
-                api_group="rbac.authorization.k8s.io",
-            ),
-        )
-
-        # Check if the RoleBinding exists
-        try:
-            rbac_api.read_namespaced_role_binding(
-                name=role_binding_name, namespace=namespace
-            )
-            logging.info(
-                f"RoleBinding '{role_binding_name}' already exists in namespace '{namespace}'."
-            )
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create the RoleBinding
-                rbac_api.create_namespaced_role_binding(
-                    namespace=namespace, body=role_binding
-                )
-                logging.info(
-                    f"RoleBinding '{role_binding_name}' created in namespace '{namespace}'."
-                )
-            else:
-                logging.error(f"Error creating RoleBinding: {e}")
-                raise
+            "roleRef": {
+                "kind": "Role",
+                "name": ROLE_NAME,
+                "apiGroup": "rbac.authorization.k8s.io",
+            },
+        }
+        server_side_apply(cls._api_client, role_binding)
 
     @classmethod
     def apply_pod_manager_yaml(cls, namespace):
         """Generate and apply the Pod Manager Deployment and Service."""
-        in_cluster = try_incluster_or_local()
+        cls.load_kube_clients()
 
         # Read configuration
         kubernetes_config = config_loader.get("kubernetes")
@@ -223,121 +319,65 @@ class SpliceOrcPlugin:
         else:
             node_port = None
 
-        # Create the Deployment object
-        apps_v1 = client.AppsV1Api()
-
-        # Define container environment variables
-        env_list = [
-            client.V1EnvVar(name=key, value=str(value))
-            for key, value in env_vars.items()
-        ]
-
-        # Define container resources
-        resource_requirements = client.V1ResourceRequirements(
-            limits=resources.get("limits"), requests=resources.get("requests")
-        )
-
         # Define the container
-        container = client.V1Container(
-            name=container_name,
-            image=image_name,
-            ports=[client.V1ContainerPort(container_port=container_port)],
-            env=env_list,
-            resources=resource_requirements,
-        )
-
-        # Define the Pod template spec
-        template = client.V1PodTemplateSpec(
-            metadata=client.V1ObjectMeta(labels={"app": container_name}),
-            spec=client.V1PodSpec(
-                containers=[container], service_account_name=service_account_name
-            ),
-        )
-
-        # Define the Deployment spec
-        spec = client.V1DeploymentSpec(
-            replicas=1,
-            selector=client.V1LabelSelector(match_labels={"app": container_name}),
-            template=template,
-        )
+        container = {
+            "name": container_name,
+            "image": image_name,
+            "ports": [{"containerPort": container_port}],
+            "env": [
+                {"name": key, "value": str(value)} for key, value in env_vars.items()
+            ],
+            "resources": {
+                key: resources[key]
+                for key in ("limits", "requests")
+                if key in resources
+            },
+        }
 
         # Define the Deployment
-        deployment = client.V1Deployment(
-            api_version="apps/v1",
-            kind="Deployment",
-            metadata=client.V1ObjectMeta(name=deployment_name, namespace=namespace),
-            spec=spec,
-        )
+        deployment = {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": deployment_name, "namespace": namespace},
+            "spec": {
+                "replicas": 1,
+                "selector": {"matchLabels": {"app": container_name}},
+                "template": {
+                    "metadata": {"labels": {"app": container_name}},
+                    "spec": {
+                        "containers": [container],
+                        "serviceAccountName": service_account_name,
+                    },
+                },
+            },
+        }
 
         # Create or update the Deployment
-        try:
-            apps_v1.read_namespaced_deployment(
-                name=deployment_name, namespace=namespace
-            )
-            # Update the deployment if it exists
-            apps_v1.patch_namespaced_deployment(
-                name=deployment_name, namespace=namespace, body=deployment
-            )
-            logging.info(
-                f"Updated Deployment '{deployment_name}' in namespace '{namespace}'"
-            )
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create the Deployment
-                apps_v1.create_namespaced_deployment(
-                    namespace=namespace, body=deployment
-                )
-                logging.info(
-                    f"Created Deployment '{deployment_name}' in namespace '{namespace}'"
-                )
-            else:
-                logging.error(f"Error creating/updating Deployment: {e}")
-                raise
+        server_side_apply(cls._api_client, deployment)
 
         # Define the service ports
-        service_ports = [
-            client.V1ServicePort(
-                protocol="TCP",
-                port=container_port,
-                target_port=container_port,
-            )
-        ]
-
+        service_port = {
+            "protocol": "TCP",
+            "port": container_port,
+            "targetPort": container_port,
+        }
         if node_port:
-            service_ports[0].node_port = node_port
-
-        # Create the Service object
-        v1 = client.CoreV1Api()
-
-        service = client.V1Service(
-            api_version="v1",
-            kind="Service",
-            metadata=client.V1ObjectMeta(name=service_name, namespace=namespace),
-            spec=client.V1ServiceSpec(
-                selector={"app": container_name},
-                ports=service_ports,
-                type=service_type,
-            ),
-        )
+            service_port["nodePort"] = node_port
+
+        # Define the Service
+        service = {
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {"name": service_name, "namespace": namespace},
+            "spec": {
+                "selector": {"app": container_name},
+                "ports": [service_port],
+                "type": service_type,
+            },
+        }
 
         # Create or update the Service
-        try:
-            v1.read_namespaced_service(name=service_name, namespace=namespace)
-            # Update the service if it exists
-            v1.patch_namespaced_service(
-                name=service_name, namespace=namespace, body=service
-            )
-            logging.info(f"Updated Service '{service_name}' in namespace '{namespace}'")
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # Create the Service
-                v1.create_namespaced_service(namespace=namespace, body=service)
-                logging.info(
-                    f"Created Service '{service_name}' in namespace '{namespace}'"
-                )
-            else:
-                logging.error(f"Error creating/updating Service: {e}")
-                raise
+        server_side_apply(cls._api_client, service)
 
     @classmethod
     def configure_pod_manager_url(cls, namespace):
@@ -346,8 +386,11 @@ class SpliceOrcPlugin:
           - If in-cluster: use 'pod-manager-service.{namespace}.svc.cluster.local:8000'
           - If local dev: use 'localhost:30080'
           - If 'LoadBalancer', call get_load_balancer_url() (optional).
+        Returns False if the URL could not be resolved and the localhost
+        placeholder was stored instead.
         """
-        in_cluster = try_incluster_or_local()
+        resolved = True
+        in_cluster = cls.load_kube_clients()
 
         service_name = config_loader.get(
             "kubernetes", "pod_manager", "service_name", default="pod-manager-service"
@@ -383,50 +426,159 @@ class SpliceOrcPlugin:
                         "Failed to retrieve LB URL, defaulting to localhost:30080"
                     )
                     pod_manager_url_local = "http://localhost:30080"
+                    resolved = False
 
-        # Update the config
+        # Update the config, skipping the rewrite when nothing changed
+        if config_loader.get("environment", "POD_MANAGER_URL") == pod_manager_url_local:
+            logging.info(f"Pod manager URL unchanged: {pod_manager_url_local}")
+            return resolved
         config_loader.set(["environment", "POD_MANAGER_URL"], pod_manager_url_local)
         config_loader.save_config()
 
         logging.info(f"Pod manager URL updated: {pod_manager_url_local}")
+        return resolved
+
+    @classmethod
+    def namespace_uid(cls, name) -> Optional[str]:
+        """UID of a namespace, or None if it is missing or cannot be read."""
+        try:
+            return cls._v1.read_namespace(name=name).metadata.uid
+        except client.exceptions.ApiException as e:
+            if e.status in (403, 404):
+                return None
+            raise
+
+    @classmethod
+    def bootstrap_key(cls, namespace) -> Optional[str]:
+        """
+        Identify the cluster, namespace and settings a bootstrap applied.
+        The kube-system UID tells apart clusters recreated at the same address
+        and the namespace UID changes if the namespace was recreated. Returns
+        None while the namespace does not exist.
+        """
+        namespace_uid = cls.namespace_uid(namespace)
+        if namespace_uid is None:
+            return None
+        state = {
+            "host": cls._api_client.configuration.host,
+            "cluster_uid": cls.namespace_uid("kube-system"),
+            "namespace": namespace,
+            "namespace_uid": namespace_uid,
+            "kubernetes": config_loader.get("kubernetes"),
+        }
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def bootstrap_sentinel(cls, namespace) -> Path:
+        """Sentinel file for the current API server and the given namespace."""
+        target = f"{cls._api_client.configuration.host}/{namespace}"
+        digest = hashlib.sha256(target.encode()).hexdigest()[:16]
+        return BOOTSTRAP_DIR / f"bootstrap-{digest}"
 
     @classmethod
-    def get_load_balancer_url(cls, namespace, timeout=300, interval=5):
-        """Retrieve the LoadBalancer service URL."""
-        in_cluster = try_incluster_or_local()
-        v1 = client.CoreV1Api()
+    def is_bootstrapped(cls, namespace) -> bool:
+        """Check for a fresh sentinel left by a bootstrap of the same cluster state."""
+        sentinel = cls.bootstrap_sentinel(namespace)
+        try:
+            if time.time() - sentinel.stat().st_mtime > BOOTSTRAP_TTL:
+                return False
+            recorded = sentinel.read_text()
+        except OSError:
+            return False
+        return recorded == cls.bootstrap_key(namespace)
+
+    @classmethod
+    def bootstrap(cls, namespace, force=False):
+        """
+        Set up the namespace, RBAC and Pod Manager. Everything after the
+        namespace only depends on the namespace existing, so the ServiceAccount,
+        Role, RoleBinding and Pod Manager are applied concurrently over the
+        shared client.
+
+        Skipped, at the cost of two namespace GETs, when the same cluster,
+        namespace and settings were bootstrapped within BOOTSTRAP_TTL, unless
+        forced. The sentinel is only written once the Pod Manager URL resolved.
+        """
+        in_cluster = cls.load_kube_clients()
+        if not force and cls.is_bootstrapped(namespace):
+            logging.info(
+                f"Namespace '{namespace}' already bootstrapped, skipping. "
+                "Use --force to re-apply."
+            )
+            # The URL is still written to config.json; only an out-of-cluster
+            # LoadBalancer lookup costs API calls, so that one is only redone
+            # when no URL is stored
+            service_type = config_loader.get(
+                "kubernetes", "pod_manager", "service_type", default="NodePort"
+            )
+            if (
+                in_cluster
+                or service_type == "NodePort"
+                or not config_loader.get("environment", "POD_MANAGER_URL")
+            ):
+                cls.configure_pod_manager_url(namespace)
+            return
+
+        service_account_name = config_loader.get(
+            "kubernetes", "service_account_name", default="jac-orc-sa"
+        )
+        cls.create_namespace(namespace)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(
+                    cls.create_service_account, namespace, service_account_name
+                ),
+                pool.submit(cls.create_role, namespace),
+                pool.submit(cls.create_role_binding, namespace, service_account_name),
+                pool.submit(cls.apply_pod_manager_yaml, namespace),
+            ]
+            for future in futures:
+                future.result()
+        if not cls.configure_pod_manager_url(namespace):
+            logging.warning(
+                f"Pod manager URL not resolved, not marking '{namespace}' "
+                "as bootstrapped."
+            )
+            return
+
+        key = cls.bootstrap_key(namespace)
+        if key:
+            sentinel = cls.bootstrap_sentinel(namespace)
+            sentinel.parent.mkdir(parents=True, exist_ok=True)
+            sentinel.write_text(key)
+
+    @classmethod
+    def get_load_balancer_url(cls, namespace, timeout=300):
+        """Retrieve the LoadBalancer service URL, watching until it is assigned."""
+        cls.load_kube_clients()
+        v1 = cls._v1
         service_name = config_loader.get(
             "kubernetes", "pod_manager", "service_name", default="pod-manager-service"
         )
-        start_time = time.time()
-        while True:
-            try:
-                service = v1.read_namespaced_service(
-                    name=service_name, namespace=namespace
-                )
+        w = watch.Watch()
+        try:
+            logging.info("Waiting for external IP to be assigned (LoadBalancer).")
+            for event in w.stream(
+                v1.list_namespaced_service,
+                namespace=namespace,
+                field_selector=f"metadata.name={service_name}",
+                timeout_seconds=timeout,
+            ):
+                service = event["object"]
                 ingress = service.status.load_balancer.ingress
-                if ingress:
+                if ingress and (ingress[0].ip or ingress[0].hostname):
                     ip = ingress[0].ip
                     hostname = ingress[0].hostname
                     port = service.spec.ports[0].port
                     logging.info(f"LB ingress => ip: {ip}, host: {hostname}")
-                    if ip:
-                        return f"http://{ip}:{port}"
-                    elif hostname:
-                        return f"http://{hostname}:{port}"
-                else:
-                    logging.info(
-                        "Waiting for external IP to be assigned (LoadBalancer)."
-                    )
-            except client.exceptions.ApiException as e:
-                logging.error(f"Error retrieving LB URL: {e}")
-                return None
-            if (time.time() - start_time) > timeout:
-                logging.error(
-                    f"Timed out after {timeout} seconds waiting for external IP."
-                )
-                return None
-            time.sleep(interval)
+                    return f"http://{ip or hostname}:{port}"
+        except client.exceptions.ApiException as e:
+            logging.error(f"Error retrieving LB URL: {e}")
+            return None
+        finally:
+            w.stop()
+        logging.error(f"Timed out after {timeout} seconds waiting for external IP.")
+        return None
 
     @staticmethod
     @hookimpl
@@ -434,10 +586,11 @@ class SpliceOrcPlugin:
         """Creating Jac CLI commands."""
 
         @cmd_registry.register
-        def orc_initialize(namespace: str) -> None:
+        def orc_initialize(namespace: str, force: bool = False) -> None:
             """Initialize the Pod Manager and Kubernetes system.
 
             :param namespace: Kubernetes namespace to use.
+            :param force: Re-apply even if recently initialized.
             """
             # Use the provided namespace if given, else read from config
             if not namespace:
@@ -454,11 +607,7 @@ class SpliceOrcPlugin:
 
             logging.info(f"Initializing Pod Manager in namespace '{namespace}'")
 
-            # Call the class methods to perform initialization
-            SpliceOrcPlugin.create_namespace(namespace)
-            SpliceOrcPlugin.create_service_account(namespace)
-            SpliceOrcPlugin.apply_pod_manager_yaml(namespace)
-            SpliceOrcPlugin.configure_pod_manager_url(namespace)
+            SpliceOrcPlugin.bootstrap(namespace, force=force)
 
             logging.info("Initialization complete.")
 
@@ -476,34 +625,22 @@ class SpliceOrcPlugin:
         reload_module: Optional[bool],
     ) -> tuple[types.ModuleType, ...]:
         """Core Import Process with Kubernetes Pod Integration."""
-        from jaclang.runtimelib.importer import (
-            ImportPathSpec,
-            JacImporter,
-            PythonImporter,
+        ImportPathSpec, JacImporter, PythonImporter, JacMachine, JacProgram = (
+            jaclang_importers()
         )
-        from jaclang.runtimelib.machine import JacMachine, JacProgram
 
         module_config_path = os.getenv("MODULE_CONFIG_PATH", "/cfg/module_config.json")
-        try:
-            logging.info(f"Loading from {module_config_path} for module_config...")
-            with open(module_config_path, "r") as f:
-                module_config = json.load(f)
-        except Exception as e:
-            logging.warning(
-                f"No module_config found in config_map ({module_config_path}). "
-                f"Defaulting to fallback file. Error: {e}"
-            )
-            module_config = config_loader.get("module_config", default={})
-        if target in module_config and module_config[target]["load_type"] == "remote":
+        remote_modules, module_config = load_module_config(module_config_path)
+        if target in remote_modules:
+            target_config = module_config[target]
             pod_manager_url = config_loader.get("environment", "POD_MANAGER_URL")
             if not pod_manager_url:
                 logging.error(
                     "POD_MANAGER_URL is not set. Please run 'jac orc_initialize'."
                 )
                 raise Exception("POD_MANAGER_URL is not set.")
-            proxy = ModuleProxy(pod_manager_url)
-            remote_module_proxy = proxy.get_module_proxy(
-                module_name=target, module_config=module_config[target]
+            remote_module_proxy = get_module_proxy(pod_manager_url).get_module_proxy(
+                module_name=target, module_config=target_config
             )
             if items:
                 imported_items = []
@@ -0,0 +1,360 @@
+import json
+import os
+import time
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from kubernetes import client
+from kubernetes.client import (
+    V1LoadBalancerIngress,
+    V1LoadBalancerStatus,
+    V1Namespace,
+    V1ObjectMeta,
+    V1Service,
+    V1ServicePort,
+    V1ServiceSpec,
+    V1ServiceStatus,
+)
+from kubernetes.client.rest import ApiException
+
+from ..config.config_loader import ConfigLoader
+from ..plugin import splice_plugin
+from ..plugin.splice_plugin import SpliceOrcPlugin
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    splice_plugin.read_module_config.cache_clear()
+    yield
+    splice_plugin.read_module_config.cache_clear()
+
+
+@pytest.fixture
+def mock_kube_clients(monkeypatch):
+    """Skip kube config loading and hand the plugin mocked API clients."""
+    monkeypatch.setattr(SpliceOrcPlugin, "_api_client", MagicMock())
+    monkeypatch.setattr(SpliceOrcPlugin, "_v1", MagicMock())
+
+
+def service_event(ingress=None):
+    return {
+        "type": "MODIFIED",
+        "object": V1Service(
+            spec=V1ServiceSpec(ports=[V1ServicePort(port=8000)]),
+            status=V1ServiceStatus(load_balancer=V1LoadBalancerStatus(ingress=ingress)),
+        ),
+    }
+
+
+@pytest.fixture
+def mock_watch(monkeypatch):
+    stream = MagicMock()
+    stop = MagicMock()
+    monkeypatch.setattr(splice_plugin.watch.Watch, "stream", stream)
+    monkeypatch.setattr(splice_plugin.watch.Watch, "stop", stop)
+    return stream, stop
+
+
+@pytest.mark.parametrize(
+    "ingress, url",
+    [
+        (V1LoadBalancerIngress(ip="10.0.0.7"), "http://10.0.0.7:8000"),
+        (V1LoadBalancerIngress(hostname="lb.test"), "http://lb.test:8000"),
+    ],
+)
+def test_get_load_balancer_url_waits_for_ingress(
+    mock_kube_clients, mock_watch, ingress, url
+):
+    stream, stop = mock_watch
+    stream.return_value = iter([service_event(), service_event([ingress])])
+
+    assert SpliceOrcPlugin.get_load_balancer_url("orc-ns", timeout=30) == url
+    stream.assert_called_once_with(
+        SpliceOrcPlugin._v1.list_namespaced_service,
+        namespace="orc-ns",
+        field_selector="metadata.name=pod-manager-service",
+        timeout_seconds=30,
+    )
+    stop.assert_called_once()
+
+
+def test_get_load_balancer_url_times_out(mock_kube_clients, mock_watch):
+    stream, stop = mock_watch
+    stream.return_value = iter([service_event(), service_event()])
+
+    assert SpliceOrcPlugin.get_load_balancer_url("orc-ns", timeout=30) is None
+    stop.assert_called_once()
+
+
+def test_get_load_balancer_url_api_error(mock_kube_clients, mock_watch):
+    stream, stop = mock_watch
+    stream.side_effect = ApiException(status=403, reason="Forbidden")
+
+    assert SpliceOrcPlugin.get_load_balancer_url("orc-ns", timeout=30) is None
+    stop.assert_called_once()
+
+
+def write_module_config(path, module_config, mtime_ns):
+    path.write_text(json.dumps(module_config))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_module_config_rereads_changed_file(tmp_path):
+    path = tmp_path / "module_config.json"
+    write_module_config(path, {"numpy": {"load_type": "remote"}}, 1_000_000_000)
+    assert splice_plugin.load_module_config(str(path)) == (
+        frozenset({"numpy"}),
+        {"numpy": {"load_type": "remote"}},
+    )
+
+    write_module_config(path, {"numpy": {"load_type": "local"}}, 2_000_000_000)
+    assert splice_plugin.load_module_config(str(path)) == (
+        frozenset(),
+        {"numpy": {"load_type": "local"}},
+    )
+
+
+def test_load_module_config_picks_up_file_created_later(tmp_path):
+    path = tmp_path / "module_config.json"
+    fallback = splice_plugin.config_loader.get("module_config", default={})
+    assert splice_plugin.load_module_config(str(path))[1] == fallback
+
+    write_module_config(path, {"pandas": {"load_type": "remote"}}, 1_000_000_000)
+    assert splice_plugin.load_module_config(str(path)) == (
+        frozenset({"pandas"}),
+        {"pandas": {"load_type": "remote"}},
+    )
+
+
+@pytest.fixture
+def api_requests(monkeypatch):
+    """Route the plugin through a real ApiClient whose HTTP layer is mocked."""
+    api_client = client.ApiClient(client.Configuration(host="https://k8s.test"))
+    request = MagicMock(
+        return_value=MagicMock(status=200, reason="OK", data=b"{}", headers={})
+    )
+    monkeypatch.setattr(api_client.rest_client.pool_manager, "request", request)
+    monkeypatch.setattr(SpliceOrcPlugin, "_api_client", api_client)
+    monkeypatch.setattr(SpliceOrcPlugin, "_v1", client.CoreV1Api(api_client))
+    return request
+
+
+def test_bootstrap_resources_use_server_side_apply(api_requests):
+    SpliceOrcPlugin.create_namespace("orc-ns")
+    SpliceOrcPlugin.create_service_account("orc-ns", "orc-sa")
+    SpliceOrcPlugin.create_role("orc-ns")
+    SpliceOrcPlugin.create_role_binding("orc-ns", "orc-sa")
+    SpliceOrcPlugin.apply_pod_manager_yaml("orc-ns")
+
+    pod_manager = splice_plugin.config_loader.get("kubernetes", "pod_manager")
+    expected = {
+        "/api/v1/namespaces/orc-ns": "Namespace",
+        "/api/v1/namespaces/orc-ns/serviceaccounts/orc-sa": "ServiceAccount",
+        "/apis/rbac.authorization.k8s.io/v1/namespaces/orc-ns/roles/"
+        "smartimport-role": "Role",
+        "/apis/rbac.authorization.k8s.io/v1/namespaces/orc-ns/rolebindings/"
+        "smartimport-rolebinding": "RoleBinding",
+        "/apis/apps/v1/namespaces/orc-ns/deployments/"
+        + pod_manager["deployment_name"]: "Deployment",
+        "/api/v1/namespaces/orc-ns/services/" + pod_manager["service_name"]: "Service",
+    }
+    applied = {}
+    for call in api_requests.call_args_list:
+        method, url = call.args
+        parsed = urlparse(url)
+        assert method == "PATCH"
+        assert parse_qs(parsed.query) == {
+            "fieldManager": ["jac-splice-orc"],
+            "force": ["True"],
+        }
+        assert call.kwargs["headers"]["Content-Type"] == "application/apply-patch+yaml"
+        applied[parsed.path] = json.loads(call.kwargs["body"])["kind"]
+    assert applied == expected
+
+
+@pytest.fixture
+def bootstrap_env(monkeypatch, tmp_path):
+    """Run bootstrap against a mocked cluster, config copy and sentinel dir."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(splice_plugin.config_loader.config), encoding="utf-8"
+    )
+    monkeypatch.setattr(splice_plugin, "config_loader", ConfigLoader(str(config_path)))
+    monkeypatch.setattr(splice_plugin, "BOOTSTRAP_DIR", tmp_path / "cache")
+
+    uids = {"kube-system": "cluster-1", "orc-ns": "namespace-1"}
+    v1 = MagicMock()
+    v1.read_namespace.side_effect = lambda name: V1Namespace(
+        metadata=V1ObjectMeta(name=name, uid=uids[name])
+    )
+    api_client = MagicMock()
+    api_client.configuration.host = "https://k8s.test"
+    monkeypatch.setattr(SpliceOrcPlugin, "_api_client", api_client)
+    monkeypatch.setattr(SpliceOrcPlugin, "_v1", v1)
+    monkeypatch.setattr(SpliceOrcPlugin, "_in_cluster", False)
+
+    apply = MagicMock()
+    monkeypatch.setattr(splice_plugin, "server_side_apply", apply)
+    return apply, uids
+
+
+def test_bootstrap_skips_when_recently_bootstrapped(bootstrap_env):
+    apply, _ = bootstrap_env
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    assert apply.call_count == 6
+    assert SpliceOrcPlugin.bootstrap_sentinel("orc-ns").exists()
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    apply.assert_not_called()
+
+
+def test_bootstrap_sentinel_per_namespace_and_host(bootstrap_env):
+    apply, uids = bootstrap_env
+    uids["other-ns"] = "namespace-2"
+    SpliceOrcPlugin.bootstrap("orc-ns")
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("other-ns")
+    assert apply.call_count == 6
+
+    # Bootstrapping another namespace leaves the first one's sentinel intact
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    apply.assert_not_called()
+
+    SpliceOrcPlugin._api_client.configuration.host = "https://other.test"
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    assert apply.call_count == 6
+
+
+def test_bootstrap_skip_restores_missing_pod_manager_url(bootstrap_env):
+    apply, _ = bootstrap_env
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    del splice_plugin.config_loader.config["environment"]["POD_MANAGER_URL"]
+    splice_plugin.config_loader.save_config()
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    apply.assert_not_called()
+    saved = ConfigLoader(splice_plugin.config_loader.config_file_path)
+    assert saved.get("environment", "POD_MANAGER_URL") == "http://localhost:30080"
+
+
+def test_bootstrap_skip_reuses_stored_load_balancer_url(bootstrap_env, monkeypatch):
+    splice_plugin.config_loader.set(
+        ["kubernetes", "pod_manager", "service_type"], "LoadBalancer"
+    )
+    get_load_balancer_url = MagicMock(return_value="http://10.0.0.7:8000")
+    monkeypatch.setattr(SpliceOrcPlugin, "get_load_balancer_url", get_load_balancer_url)
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    get_load_balancer_url.assert_called_once()
+
+    get_load_balancer_url.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    get_load_balancer_url.assert_not_called()
+    assert (
+        splice_plugin.config_loader.get("environment", "POD_MANAGER_URL")
+        == "http://10.0.0.7:8000"
+    )
+
+
+def test_bootstrap_reruns_after_ttl(bootstrap_env):
+    apply, _ = bootstrap_env
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    expired = time.time() - splice_plugin.BOOTSTRAP_TTL - 1
+    os.utime(SpliceOrcPlugin.bootstrap_sentinel("orc-ns"), (expired, expired))
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    assert apply.call_count == 6
+
+
+def test_bootstrap_reruns_when_forced(bootstrap_env):
+    apply, _ = bootstrap_env
+    SpliceOrcPlugin.bootstrap("orc-ns")
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns", force=True)
+    assert apply.call_count == 6
+
+
+@pytest.mark.parametrize("recreated", ["kube-system", "orc-ns"])
+def test_bootstrap_reruns_when_cluster_or_namespace_recreated(bootstrap_env, recreated):
+    apply, uids = bootstrap_env
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    uids[recreated] = "recreated"
+
+    apply.reset_mock()
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    assert apply.call_count == 6
+
+
+def test_bootstrap_without_pod_manager_url_writes_no_sentinel(
+    bootstrap_env, monkeypatch
+):
+    splice_plugin.config_loader.set(
+        ["kubernetes", "pod_manager", "service_type"], "LoadBalancer"
+    )
+    monkeypatch.setattr(
+        SpliceOrcPlugin, "get_load_balancer_url", MagicMock(return_value=None)
+    )
+    SpliceOrcPlugin.bootstrap("orc-ns")
+    assert not SpliceOrcPlugin.bootstrap_sentinel("orc-ns").exists()
+
+
+def test_bootstrap_failed_apply_writes_no_sentinel(bootstrap_env):
+    apply, _ = bootstrap_env
+    apply.side_effect = ApiException(status=500, reason="Internal Server Error")
+    with pytest.raises(ApiException):
+        SpliceOrcPlugin.bootstrap("orc-ns")
+    assert not SpliceOrcPlugin.bootstrap_sentinel("orc-ns").exists()
+
+
+def test_jac_import_routes_remote_and_local_targets(monkeypatch, tmp_path):
+    path = tmp_path / "module_config.json"
+    module_config = {
+        "numpy": {"load_type": "remote", "lib_cpu_req": "500m"},
+        "helpers": {"load_type": "local"},
+        "notes": "not a module entry",
+    }
+    write_module_config(path, module_config, 1_000_000_000)
+    monkeypatch.setenv("MODULE_CONFIG_PATH", str(path))
+
+    get_module_proxy = MagicMock()
+    monkeypatch.setattr(splice_plugin, "get_module_proxy", get_module_proxy)
+    spec, jac_importer, python_importer, jac_machine, jac_program = (
+        MagicMock() for _ in range(5)
+    )
+    monkeypatch.setattr(
+        splice_plugin,
+        "jaclang_importers",
+        lambda: (spec, jac_importer, python_importer, jac_machine, jac_program),
+    )
+    import_args = dict(
+        base_path=str(tmp_path),
+        absorb=False,
+        cachable=True,
+        mdl_alias=None,
+        override_name=None,
+        lng="jac",
+        items=None,
+        reload_module=None,
+    )
+
+    (remote,) = SpliceOrcPlugin.jac_import(target="numpy", **import_args)
+    get_module_proxy.assert_called_once_with(
+        splice_plugin.config_loader.get("environment", "POD_MANAGER_URL")
+    )
+    get_module_proxy.return_value.get_module_proxy.assert_called_once_with(
+        module_name="numpy", module_config=module_config["numpy"]
+    )
+    assert remote is get_module_proxy.return_value.get_module_proxy.return_value
+    jac_importer.assert_not_called()
+
+    get_module_proxy.reset_mock()
+    (local,) = SpliceOrcPlugin.jac_import(target="helpers", **import_args)
+    get_module_proxy.assert_not_called()
+    jac_importer.return_value.run_import.assert_called_once()
+    assert local is jac_importer.return_value.run_import.return_value.ret_mod
@@ -13,6 +13,12 @@ from jaclang.utils.test import TestCaseMicroSuite
 class TestLarkParser(TestCaseMicroSuite):
     """Test Jac self.prse."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the standalone Lark parser tables once for the class."""
+        super().setUpClass()
+        cls.lark = jl.Lark_StandAlone()
+
     def setUp(self) -> None:
         """Set up test."""
         return super().setUp()
@@ -68,7 +74,7 @@ class TestLarkParser(TestCaseMicroSuite):
 
     def test_enum_matches_lark_toks(self) -> None:
         """Test that enum stays synced with lexer."""
-        tokens = [x.name for x in jl.Lark_StandAlone().parser.lexer_conf.terminals]
+        tokens = [x.name for x in self.lark.parser.lexer_conf.terminals]
         for token in tokens:
             self.assertIn(token, Tokens.__members__)
         for token in Tokens:
@@ -80,7 +86,7 @@ class TestLarkParser(TestCaseMicroSuite):
         """Test that enum stays synced with lexer."""
         rules = {
             x.origin.name
-            for x in jl.Lark_StandAlone().parser.parser_conf.rules
+            for x in self.lark.parser.parser_conf.rules
             if not x.origin.name.startswith("_")
         }
         parse_funcs = []